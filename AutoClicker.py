@@ -9,20 +9,277 @@ from tkinter import ttk, messagebox, simpledialog
 import threading
 import time
 import math
-
-# optional libs
-try:
-    import pyautogui
-    pyautogui.PAUSE = 0
-    pyautogui.FAILSAFE = False
-except Exception:
-    pyautogui = None
-
+import sys
+import contextlib
+from array import array
+from collections import deque
+import ctypes
+import ctypes.util
+
+# optional libs (pyautogui is imported lazily, only as the click fallback)
 try:
     import keyboard
 except Exception:
     keyboard = None
 
+_IS_WINDOWS = sys.platform == "win32"
+if _IS_WINDOWS:
+    from ctypes import wintypes
+    _user32 = ctypes.WinDLL("user32")
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _user32.GetAsyncKeyState.restype = ctypes.c_short
+    _user32.GetAsyncKeyState.argtypes = (ctypes.c_int,)
+
+# ----------------------------
+# Helper: native click backend — picked once at import via sys.platform.
+# Each backend returns click(button, clicks) taking "left"/"right"/"middle"
+# and 1 or 2; pyautogui is only used when the native API can't be loaded.
+# ----------------------------
+def _load_library(name):
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise OSError(f"{name} not found")
+    return ctypes.cdll.LoadLibrary(path)
+
+def _clicks_from(click_down, click_up):
+    # click(button, clicks) for backends that post one event at a time
+    def click(button, clicks):
+        click_down(button)
+        click_up(button)
+        if clicks == 2:
+            click_down(button)
+            click_up(button)
+    return click
+
+def _win32_backend():
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG),
+                    ("mouseData", wintypes.DWORD), ("dwFlags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", MOUSEINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    send_input = _user32.SendInput
+    send_input.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    send_input.restype = wintypes.UINT
+    size = ctypes.sizeof(INPUT)
+
+    # MOUSEEVENTF_*DOWN / *UP flags; INPUT arrays are built once per button so
+    # a single (down, up) or double (down, up, down, up) is one SendInput call
+    flags = {"left": (0x0002, 0x0004), "right": (0x0008, 0x0010), "middle": (0x0020, 0x0040)}
+    batches = {}
+    for button, (down_flag, up_flag) in flags.items():
+        down = INPUT(type=0, u=_INPUTUNION(mi=MOUSEINPUT(dwFlags=down_flag)))
+        up = INPUT(type=0, u=_INPUTUNION(mi=MOUSEINPUT(dwFlags=up_flag)))
+        batches[button, 1] = (2, (INPUT * 2)(down, up))
+        batches[button, 2] = (4, (INPUT * 4)(down, up, down, up))
+
+    def click(button, clicks):
+        count, inputs = batches[button, clicks]
+        send_input(count, inputs, size)
+
+    return click
+
+def _quartz_backend():
+    cg = _load_library("ApplicationServices")
+    cf = _load_library("CoreFoundation")
+
+    class CGPoint(ctypes.Structure):
+        _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
+
+    cg.CGEventCreate.restype = ctypes.c_void_p
+    cg.CGEventCreate.argtypes = (ctypes.c_void_p,)
+    cg.CGEventGetLocation.restype = CGPoint
+    cg.CGEventGetLocation.argtypes = (ctypes.c_void_p,)
+    cg.CGEventCreateMouseEvent.restype = ctypes.c_void_p
+    cg.CGEventCreateMouseEvent.argtypes = (ctypes.c_void_p, ctypes.c_uint32, CGPoint, ctypes.c_uint32)
+    cg.CGEventPost.restype = None
+    cg.CGEventPost.argtypes = (ctypes.c_uint32, ctypes.c_void_p)
+    cf.CFRelease.restype = None
+    cf.CFRelease.argtypes = (ctypes.c_void_p,)
+
+    # (down event type, up event type, CGMouseButton)
+    events = {"left": (1, 2, 0), "right": (3, 4, 1), "middle": (25, 26, 2)}
+
+    def post(event_type, mouse_button):
+        # Quartz mouse events need a location, so click where the cursor is
+        here = cg.CGEventCreate(None)
+        loc = cg.CGEventGetLocation(here)
+        cf.CFRelease(here)
+        ev = cg.CGEventCreateMouseEvent(None, event_type, loc, mouse_button)
+        cg.CGEventPost(0, ev)  # kCGHIDEventTap
+        cf.CFRelease(ev)
+
+    def click_down(button):
+        down_type, _, mouse_button = events[button]
+        post(down_type, mouse_button)
+
+    def click_up(button):
+        _, up_type, mouse_button = events[button]
+        post(up_type, mouse_button)
+
+    return _clicks_from(click_down, click_up)
+
+def _xtest_backend():
+    x11 = _load_library("X11")
+    xtst = _load_library("Xtst")
+    x11.XOpenDisplay.restype = ctypes.c_void_p
+    x11.XOpenDisplay.argtypes = (ctypes.c_char_p,)
+    x11.XFlush.argtypes = (ctypes.c_void_p,)
+    xtst.XTestFakeButtonEvent.argtypes = (ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong)
+
+    display = x11.XOpenDisplay(None)
+    if not display:
+        raise OSError("cannot open X display")
+    buttons = {"left": 1, "middle": 2, "right": 3}
+
+    def click_down(button):
+        xtst.XTestFakeButtonEvent(display, buttons[button], True, 0)
+        x11.XFlush(display)
+
+    def click_up(button):
+        xtst.XTestFakeButtonEvent(display, buttons[button], False, 0)
+        x11.XFlush(display)
+
+    return _clicks_from(click_down, click_up)
+
+def _select_click_backend():
+    if _IS_WINDOWS:
+        native = _win32_backend
+    elif sys.platform == "darwin":
+        native = _quartz_backend
+    else:
+        native = _xtest_backend
+    try:
+        return native()
+    except Exception:
+        pass
+    # pyautogui pulls in C extensions (pyobjc on macOS, Pillow via pyscreeze)
+    # that re-enable the GIL on free-threaded builds, so only import it here
+    try:
+        import pyautogui
+        pyautogui.PAUSE = 0
+        pyautogui.FAILSAFE = False
+    except Exception:
+        return None
+    return _clicks_from(lambda button: pyautogui.mouseDown(button=button),
+                        lambda button: pyautogui.mouseUp(button=button))
+
+_click = _select_click_backend()
+
+# On free-threaded CPython (3.13t+) click_loop and the Tk thread really run in
+# parallel, so the click counters are updated under a lock. Checked after the
+# optional imports: an extension that re-enables the GIL turns this back off.
+_GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# ----------------------------
+# Helper: Win32 global hotkey — RegisterHotKey lets the OS filter keystrokes
+# and post a single WM_HOTKEY for our combo, instead of a low-level hook
+# running every key event on the system through Python. The registered combo
+# is swallowed system-wide: no other app receives it while we run.
+# ----------------------------
+_VK_CODES = {chr(c).lower(): c for c in range(0x41, 0x5B)}
+_VK_CODES.update({str(d): 0x30 + d for d in range(10)})
+_VK_CODES.update({f"f{n}": 0x6F + n for n in range(1, 25)})
+_VK_CODES.update({
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "pause": 0x13, "caps lock": 0x14,
+    "esc": 0x1B, "space": 0x20, "page up": 0x21, "page down": 0x22, "end": 0x23,
+    "home": 0x24, "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    "print screen": 0x2C, "insert": 0x2D, "delete": 0x2E, "num lock": 0x90,
+    "scroll lock": 0x91, "menu": 0x5D,
+    # numpad ("+" can't be used in a name: it separates combo parts)
+    "num multiply": 0x6A, "num add": 0x6B, "num subtract": 0x6D,
+    "num decimal": 0x6E, "num divide": 0x6F,
+    # OEM punctuation, US layout names
+    ";": 0xBA, "=": 0xBB, ",": 0xBC, "-": 0xBD, ".": 0xBE, "/": 0xBF,
+    "`": 0xC0, "[": 0xDB, "\\": 0xDC, "]": 0xDD, "'": 0xDE,
+})
+_VK_CODES.update({f"num {d}": 0x60 + d for d in range(10)})
+_VK_NAMES = {vk: name for name, vk in _VK_CODES.items()}
+# every virtual key recording watches: keyboard keys only (mouse buttons are
+# 0x01-0x06) and no modifiers, which are read separately to build the combo
+_MODIFIER_VKS = {0x10, 0x11, 0x12, 0x5B, 0x5C, 0xA0, 0xA1, 0xA2, 0xA3, 0xA4, 0xA5}
+_RECORD_SCAN_VKS = [vk for vk in range(0x08, 0xFF) if vk not in _MODIFIER_VKS]
+_VK_ALIASES = {"escape": "esc", "return": "enter", "del": "delete", "ins": "insert",
+               "pgup": "page up", "pgdn": "page down", "control": "ctrl", "win": "windows"}
+# name -> (MOD_* flag, virtual key of the modifier itself)
+_HOTKEY_MODIFIERS = {"ctrl": (0x0002, 0x11), "shift": (0x0004, 0x10),
+                     "alt": (0x0001, 0x12), "windows": (0x0008, 0x5B)}
+# keys that may be registered without Ctrl/Alt/Win; anything else on its own
+# (or with just Shift) would stop that key from typing in every other app
+_SAFE_PLAIN_KEYS = {f"f{n}" for n in range(1, 25)} | {"pause", "scroll lock"}
+_MOD_NOREPEAT = 0x4000
+_WM_HOTKEY = 0x0312
+_WM_QUIT = 0x0012
+
+def _parse_win32_hotkey(hotkey):
+    # "f6", "a", "ctrl+shift+x" -> (modifier flags, virtual key)
+    mods, keys = [], []
+    for part in hotkey.lower().split("+"):
+        part = part.strip()
+        part = _VK_ALIASES.get(part, part)
+        (mods if part in _HOTKEY_MODIFIERS else keys).append(part)
+    if not keys and len(mods) == 1:
+        # a lone modifier is used as a plain key
+        return 0, _HOTKEY_MODIFIERS[mods[0]][1]
+    if len(keys) != 1 or keys[0] not in _VK_CODES:
+        raise ValueError(f"unsupported hotkey: {hotkey}")
+    flags = 0
+    for m in mods:
+        flags |= _HOTKEY_MODIFIERS[m][0]
+    return flags, _VK_CODES[keys[0]]
+
+def _win32_hotkey_problem(key, mods):
+    # None if key+mods is fine to register, else a message for the status bar
+    if key in _SAFE_PLAIN_KEYS or {"ctrl", "alt", "windows"} & set(mods):
+        return None
+    name = "+".join(mods + [key]).upper()
+    return f"{name} would be blocked in all other apps - use F1-F24 or add Ctrl/Alt"
+
+def _key_down(vk):
+    return bool(_user32.GetAsyncKeyState(vk) & 0x8000)
+
+class Win32Hotkey:
+    # RegisterHotKey(None, ...) binds to the calling thread's message queue, so
+    # registering, the GetMessage loop and unregistering all run on one thread.
+    def __init__(self, hotkey, callback):
+        self.modifiers, self.vk = _parse_win32_hotkey(hotkey)
+        self._callback = callback
+        self._thread_id = None
+        self._registered = False
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(1.0)
+        if not self._registered:
+            raise OSError(f"RegisterHotKey failed for {hotkey}")
+
+    def _run(self):
+        self._thread_id = _kernel32.GetCurrentThreadId()
+        self._registered = bool(_user32.RegisterHotKey(None, 1, self.modifiers | _MOD_NOREPEAT, self.vk))
+        self._ready.set()
+        if not self._registered:
+            return
+        msg = wintypes.MSG()
+        try:
+            while _user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == _WM_HOTKEY:
+                    try:
+                        self._callback()
+                    except Exception as e:
+                        print("Hotkey callback error:", e)
+        finally:
+            _user32.UnregisterHotKey(None, 1)
+
+    def stop(self):
+        if self._registered and self._thread_id:
+            _user32.PostThreadMessageW(self._thread_id, _WM_QUIT, 0, 0)
+            self._thread.join(1.0)
+
 # ----------------------------
 # Helper: Rounded-like Button (Canvas) — visually modern but API like Button
 # ----------------------------
@@ -40,7 +297,19 @@ class FancyButton(tk.Canvas):
         self._font = font or ("Segoe UI", 10, "bold")
         self._padx = padx
         self._is_hover = False
-        self.bind("<Configure>", lambda e: self._draw())
+        # Canvas items are created once; redraws only move or recolor them
+        try:
+            self._poly_id = self.create_polygon(0, 0, 0, 0, smooth=True, fill=bg, outline="")
+            self._is_rect = False
+        except Exception:
+            # fallback rectangle
+            self._poly_id = self.create_rectangle(0, 0, 0, 0, fill=bg, outline="")
+            self._is_rect = True
+        self._text_id = self.create_text(0, 0, text=self._text, font=self._font, fill=self._fg)
+        # what the canvas currently shows, so unchanged recolors cost nothing
+        self._current_fill = bg
+        self._current_fg = self._fg
+        self.bind("<Configure>", lambda e: self._reshape(e.width, self._height))
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
         self.bind("<Button-1>", lambda e: self._on_click())
@@ -48,11 +317,11 @@ class FancyButton(tk.Canvas):
 
     def _on_enter(self, e):
         self._is_hover = True
-        self._draw()
+        self._set_fill(self._hover)
 
     def _on_leave(self, e):
         self._is_hover = False
-        self._draw()
+        self._set_fill(self._bg)
 
     def _on_click(self):
         if callable(self._cmd):
@@ -62,42 +331,57 @@ class FancyButton(tk.Canvas):
                 print("Button command error:", e)
 
     def configure_colors(self, bg=None, fg=None, hover=None):
-        if bg: self._bg = bg
-        if fg: self._fg = fg
-        if hover: self._hover = hover
-        self._draw()
+        bg = bg or self._bg
+        fg = fg or self._fg
+        hover = hover or self._hover
+        if (bg, fg, hover) == (self._bg, self._fg, self._hover):
+            return
+        self._bg, self._fg, self._hover = bg, fg, hover
+        self._recolor()
 
     def configure_text(self, text):
         self._text = text
-        self._draw()
+        self.itemconfig(self._text_id, text=text)
 
-    def _draw(self):
-        self.delete("all")
-        w = self.winfo_width() or 120
-        h = self._height
+    def _set_fill(self, fill):
+        if fill == self._current_fill:
+            return
+        self.itemconfig(self._poly_id, fill=fill)
+        self._current_fill = fill
+
+    def _recolor(self):
+        self._set_fill(self._hover if self._is_hover else self._bg)
+        if self._fg != self._current_fg:
+            self.itemconfig(self._text_id, fill=self._fg)
+            self._current_fg = self._fg
+
+    def _reshape(self, w, h):
         r = min(self._radius, h//2)
-        bg = self._hover if self._is_hover else self._bg
-        # draw rounded rectangle as polygon with smoothing
-        pts = [
-            2+r, 2,
-            w-r-2, 2,
-            w-2, 2,
-            w-2, 2+r,
-            w-2, h-r-2,
-            w-2, h-2,
-            w-r-2, h-2,
-            2+r, h-2,
-            2, h-2,
-            2, h-r-2,
-            2, 2+r,
-            2, 2
-        ]
-        try:
-            self.create_polygon(pts, smooth=True, fill=bg, outline="")
-        except Exception:
-            # fallback rectangle
-            self.create_rectangle(2,2,w-2,h-2, fill=bg, outline="")
-        self.create_text(w/2, h/2, text=self._text, font=self._font, fill=self._fg)
+        if self._is_rect:
+            self.coords(self._poly_id, 2, 2, w-2, h-2)
+        else:
+            # rounded rectangle as polygon with smoothing
+            pts = [
+                2+r, 2,
+                w-r-2, 2,
+                w-2, 2,
+                w-2, 2+r,
+                w-2, h-r-2,
+                w-2, h-2,
+                w-r-2, h-2,
+                2+r, h-2,
+                2, h-2,
+                2, h-r-2,
+                2, 2+r,
+                2, 2
+            ]
+            self.coords(self._poly_id, *pts)
+        self.coords(self._text_id, w/2, h/2)
+
+    def _draw(self):
+        # full refresh: geometry and colors
+        self._reshape(self.winfo_width() or 120, self._height)
+        self._recolor()
 
 # ----------------------------
 # Main App — all original logic preserved and relocated into class
@@ -122,22 +406,58 @@ class McAllenClicker:
         self.click_type = tk.StringVar(value="single")
         self.start_time = None
         self.actual_cps = 0
-        self.last_second_clicks = []
+        self.click_counter = 0  # monotonic click-event count; CPS is a delta of it
+        self._stats_lock = contextlib.nullcontext() if _GIL_ENABLED else threading.Lock()
+        self._last_err_t = 0.0  # click_loop reports errors at most once a second
+        self._cps_samples = deque()
+        self._refresh_after = None
+        self._timer_after = None
+        self._label_texts = {}  # last text written to each stats label
         self.is_recording_hotkey = False
+        self._win_hotkey = None  # Win32Hotkey registration (Windows only)
+        self._hotkey_hook = None  # keyboard.on_press_key handle (other platforms)
+        self._record_hook = None
+        self._hotkey_registered = False
+        # keyboard starts its global hook thread on first use (unhook_all
+        # included), so only touch it once a hook was actually installed
+        self._kb_hook_active = False
+        self._release_hook = None
+        self._hold_down = True  # hold-mode key state, kept by press/release hooks
+        self._record_prev = set()
+
+        # every FancyButton plus its base height/radius (parallel arrays),
+        # so a resize rescales them all in one pass
+        self._fancy_buttons = []
+        self._btn_base_heights = array('i')
+        self._btn_base_radii = array('i')
 
         # fonts base (will scale)
         self.base_font_large = ("Segoe UI", 28, "bold")
         self.base_font_med = ("Segoe UI", 12)
         self.base_font_small = ("Segoe UI", 9)
+        self._font_cache = {}
+        self._last_scale = None
 
         # Build responsive UI (pack + expand only)
         self._build_ui()
 
         # Bind resize for font scaling
-        self.root.bind("<Configure>", self._on_root_resize_throttled())
+        self._resize_after_id = None
+        self.root.bind("<Configure>", self._on_root_configure)
 
     # ------------- UI BUILD -------------
     def _build_ui(self):
+        # Mirror the setting vars into plain attributes so click_loop never
+        # does a Tcl round-trip; the write traces keep them current.
+        self._mode_cache = self.click_mode.get()
+        self._button_cache = self.button_type.get()
+        self._click_type_cache = self.click_type.get()
+        self._on_cps_write()
+        self.click_mode.trace_add("write", lambda *a: setattr(self, "_mode_cache", self.click_mode.get()))
+        self.button_type.trace_add("write", lambda *a: setattr(self, "_button_cache", self.button_type.get()))
+        self.click_type.trace_add("write", lambda *a: setattr(self, "_click_type_cache", self.click_type.get()))
+        self.cps.trace_add("write", self._on_cps_write)
+
         # Header (top)
         self.header = tk.Frame(self.root, bg="#0b0d0e")
         self.header.pack(side="top", fill="x")
@@ -177,6 +497,11 @@ class McAllenClicker:
                                font=self.base_font_small, bg="#0b0d0e", fg="#94a3b8")
         self.status.pack(side="bottom", fill="x")
 
+    def _on_cps_write(self, *args):
+        # click_loop only reads the precomputed sleep interval
+        self._cps_cache = self.cps.get()
+        self._cps_interval = max(0.002, 1.0 / max(0.1, self._cps_cache))
+
     def _build_left(self, parent):
         pad = 12
         container = tk.Frame(parent, bg=parent.cget("bg"))
@@ -187,7 +512,7 @@ class McAllenClicker:
                                      bg="#0f1113", fg="#4a9eff", width=12, height=2, relief="flat")
         self.hotkey_label.pack(pady=(8,10))
 
-        self.hotkey_btn = FancyButton(container, text="Set Hotkey", command=self.start_recording_hotkey,
+        self.hotkey_btn = self._fancy_button(container, text="Set Hotkey", command=self.start_recording_hotkey,
                                       bg="#2a2f36", hover="#3a4f77", fg="#fff", font=("Segoe UI",10,"bold"))
         self.hotkey_btn.pack(pady=(0,14), fill="x")
 
@@ -234,7 +559,7 @@ class McAllenClicker:
         presets = tk.Frame(container, bg=container.cget("bg"))
         presets.pack(pady=(12,10))
         for i, cps in enumerate([10, 20, 50, 100]):
-            b = FancyButton(presets, text=str(cps), command=lambda c=cps: self.set_cps_preset(c),
+            b = self._fancy_button(presets, text=str(cps), command=lambda c=cps: self.set_cps_preset(c),
                             bg="#2b2f34", hover="#3a4f77", fg="#fff", font=("Segoe UI",10,"bold"))
             b.pack(side="left", padx=6, pady=4, ipadx=6)
 
@@ -281,16 +606,23 @@ class McAllenClicker:
         # Action buttons
         actions = tk.Frame(container, bg=container.cget("bg"))
         actions.pack(pady=(18,6))
-        self.start_btn = FancyButton(actions, text="START", command=self.toggle_clicking,
+        self.start_btn = self._fancy_button(actions, text="START", command=self.toggle_clicking,
                                      bg="#4a9eff", hover="#66b0ff", fg="#fff", font=("Segoe UI",11,"bold"))
         self.start_btn.pack(side="left", padx=8, ipadx=4)
-        self.reset_btn = FancyButton(actions, text="RESET", command=self.reset_stats,
+        self.reset_btn = self._fancy_button(actions, text="RESET", command=self.reset_stats,
                                      bg="#2b2f34", hover="#3a4f77", fg="#fff", font=("Segoe UI",11,"bold"))
         self.reset_btn.pack(side="left", padx=8, ipadx=4)
 
         # Initially disable start until hotkey set (preserve original behavior)
         self.start_btn_state_update(disable= (self.hotkey.get() == "NOT SET"))
 
+    def _fancy_button(self, parent, **kwargs):
+        btn = FancyButton(parent, **kwargs)
+        self._fancy_buttons.append(btn)
+        self._btn_base_heights.append(btn._height)
+        self._btn_base_radii.append(btn._radius)
+        return btn
+
     # -------------------------
     # UI utility helpers
     # -------------------------
@@ -298,17 +630,24 @@ class McAllenClicker:
         if self.is_clicking:
             messagebox.showwarning("Warning", "Stop clicking first")
             return
+        # a second click while waiting cancels recording
+        if self.is_recording_hotkey:
+            self._cancel_recording()
+            return
 
         self.is_recording_hotkey = True
         self.hotkey_btn.configure_text("Press a key...")
-        self.status.config(text="Waiting for key press...")
+        self.status.config(text="Waiting for key press... (click again to cancel)")
 
         # Unhook previous if any
-        try:
-            if self.current_hotkey:
-                keyboard.unhook_key(self.current_hotkey)
-        except Exception:
-            pass
+        self._unregister_hotkey()
+
+        # Windows: poll key state while recording; no global hook is installed
+        if _IS_WINDOWS:
+            self.status.config(text="Waiting for key press... (Esc or click again to cancel)")
+            self._record_prev = self._held_keys()
+            self.root.after(33, self._poll_recorded_key)
+            return
 
         # If keyboard not available, fallback to dialog
         if keyboard is None:
@@ -330,30 +669,128 @@ class McAllenClicker:
             name = getattr(event, "name", None)
             if not name:
                 return
+            # runs on the keyboard hook thread: claim the key here, then let
+            # the Tk thread do the widget updates
+            self.is_recording_hotkey = False
+            self.root.after(0, lambda: self._apply_recorded_hotkey(name))
+
+        try:
+            if self._record_hook is not None:
+                keyboard.unhook(self._record_hook)
+            self._record_hook = keyboard.on_press(_on_press)
+            self._kb_hook_active = True
+        except Exception:
+            messagebox.showerror("Error", "Unable to record hotkey")
+            self.is_recording_hotkey = False
+            self.hotkey_btn.configure_text("Set Hotkey")
+            self.status.config(text="")
+
+    def _apply_recorded_hotkey(self, name):
+        if self._record_hook is not None:
             try:
-                keyboard.unhook_all()
+                keyboard.unhook(self._record_hook)
             except Exception:
                 pass
-            self.is_recording_hotkey = False
-            name_upper = name.upper()
-            self.hotkey.set(name_upper)
-            self.current_hotkey = name.lower()
-            # register
+            self._record_hook = None
+        self.is_recording_hotkey = False
+        name_upper = name.upper()
+        self.hotkey.set(name_upper)
+        self.current_hotkey = name.lower()
+        self.start_btn_state_update(disable=False)
+        self.hotkey_btn.configure_text("Set Hotkey")
+        if self._register_hotkey():
+            self.status.config(text=f"Ready - Press {name_upper} to start")
+        else:
+            self.status.config(text=f"{name_upper} is used by another app - choose another hotkey")
+
+    def _cancel_recording(self):
+        if self._record_hook is not None:
             try:
-                keyboard.on_press_key(self.current_hotkey, lambda e: self.toggle_clicking())
+                keyboard.unhook(self._record_hook)
             except Exception:
                 pass
-            self.start_btn_state_update(disable=False)
-            self.hotkey_btn.configure_text("Set Hotkey")
-            self.status.config(text=f"Ready - Press {name_upper} to start")
+            self._record_hook = None
+        self.is_recording_hotkey = False
+        self.hotkey_btn.configure_text("Set Hotkey")
+        # recording unregistered the previous hotkey; put it back
+        if self.current_hotkey and self._register_hotkey():
+            self.status.config(text=f"Ready - Press {self.hotkey.get()} to start")
+        else:
+            self.status.config(text="Hotkey recording cancelled")
+
+    def _held_keys(self):
+        return {vk for vk in _RECORD_SCAN_VKS if _key_down(vk)}
 
+    def _poll_recorded_key(self):
+        # ~30 Hz GetAsyncKeyState sampling; modifiers held with the key form a combo
+        if not self.is_recording_hotkey:
+            return
+        held = self._held_keys()
+        pressed = held - self._record_prev
+        self._record_prev = held
+        if not pressed:
+            self.root.after(33, self._poll_recorded_key)
+            return
+        mods = [m for m, (_, vk) in _HOTKEY_MODIFIERS.items() if _key_down(vk)]
+        known = sorted(_VK_NAMES[vk] for vk in pressed if vk in _VK_NAMES)
+        if not known:
+            self.status.config(text="That key isn't supported - press another key (Esc to cancel)")
+            self.root.after(33, self._poll_recorded_key)
+            return
+        key = known[0]
+        if key == "esc" and not mods:
+            self._cancel_recording()
+            return
+        problem = _win32_hotkey_problem(key, mods)
+        if problem:
+            # keep recording so the user can pick another key
+            self.status.config(text=problem)
+            self.root.after(33, self._poll_recorded_key)
+            return
+        self._apply_recorded_hotkey("+".join(mods + [key]))
+
+    def _register_hotkey(self):
+        # One registration per recorded hotkey, reused across start/stop:
+        # RegisterHotKey on Windows, a single keyboard.on_press_key hook
+        # elsewhere; either way the toggle is handed to the Tk thread
+        self._unregister_hotkey()
+        if not self.current_hotkey:
+            return False
         try:
-            keyboard.on_press(_on_press)
+            if _IS_WINDOWS:
+                self._win_hotkey = Win32Hotkey(self.current_hotkey,
+                                               lambda: self.root.after(0, self.toggle_clicking))
+            elif keyboard:
+                def _on_hotkey_press(e):
+                    # hook thread: record the key state now, toggle on the Tk thread
+                    self._hold_down = True
+                    self.root.after(0, self.toggle_clicking)
+                self._hold_down = False
+                self._hotkey_hook = keyboard.on_press_key(self.current_hotkey, _on_hotkey_press)
+                self._kb_hook_active = True
+                self._release_hook = keyboard.on_release_key(self.current_hotkey,
+                                                             lambda e: setattr(self, "_hold_down", False))
+            else:
+                return False
         except Exception:
-            messagebox.showerror("Error", "Unable to record hotkey")
-            self.is_recording_hotkey = False
-            self.hotkey_btn.configure_text("Set Hotkey")
-            self.status.config(text="")
+            return False
+        self._hotkey_registered = True
+        return True
+
+    def _unregister_hotkey(self):
+        if self._win_hotkey is not None:
+            self._win_hotkey.stop()
+            self._win_hotkey = None
+        for hook in (self._hotkey_hook, self._release_hook):
+            if hook is not None:
+                try:
+                    keyboard.unhook(hook)
+                except Exception:
+                    pass
+        self._hotkey_hook = None
+        self._release_hook = None
+        self._hold_down = True
+        self._hotkey_registered = False
 
     def start_btn_state_update(self, disable=True):
         # tweak visual disabled state by changing color
@@ -393,9 +830,10 @@ class McAllenClicker:
 
     def start_clicking(self):
         self.is_clicking = True
-        self.start_time = time.time()
-        self.session_clicks = 0
-        self.last_second_clicks = []
+        self.start_time = time.monotonic()
+        with self._stats_lock:
+            self.session_clicks = 0
+        self._cps_samples = deque([(time.perf_counter(), self.click_counter)])
 
         self.start_btn.configure_text("STOP")
         self.start_btn.configure_colors(bg="#ff534f", hover="#ff6763", fg="#fff")
@@ -403,20 +841,15 @@ class McAllenClicker:
         # disable hotkey during run visually (no actual disable needed)
         self.hotkey_btn.configure_colors(bg="#2b2f34", hover="#3a4f77")
 
-        # register hotkey if keyboard available
-        if keyboard:
-            try:
-                keyboard.unhook_all()
-                if self.current_hotkey:
-                    keyboard.on_press_key(self.current_hotkey, lambda e: self.toggle_clicking())
-            except Exception:
-                pass
+        # the hotkey registered while recording stays in place; only retry
+        # if that registration didn't succeed
+        if not self._hotkey_registered:
+            self._register_hotkey()
 
-        # threads as original
-        t1 = threading.Thread(target=self.click_loop, daemon=True)
-        t2 = threading.Thread(target=self.monitor_cps, daemon=True)
-        t3 = threading.Thread(target=self.update_timer, daemon=True)
-        t1.start(); t2.start(); t3.start()
+        # only clicking needs its own thread; stats refresh on the Tk thread
+        threading.Thread(target=self.click_loop, daemon=True).start()
+        self._refresh_after = self.root.after(100, self._refresh_stats)
+        self._tick_timer()
         self.status.config(text=f"Active - Press {self.hotkey.get()} to stop")
 
     def stop_clicking(self):
@@ -425,93 +858,132 @@ class McAllenClicker:
         self.start_btn.configure_colors(bg="#4a90ff", hover="#66b0ff", fg="#fff")
         # re-enable hotkey visually
         self.hotkey_btn.configure_colors(bg="#2a2f34", hover="#3a4f77")
+        if self._refresh_after is not None:
+            self.root.after_cancel(self._refresh_after)
+            self._refresh_after = None
+        if self._timer_after is not None:
+            self.root.after_cancel(self._timer_after)
+            self._timer_after = None
+        self._refresh_stats()  # show the final totals
         self.status.config(text=f"Stopped - Press {self.hotkey.get()} to restart")
 
     def click_loop(self):
+        # ctypes foreign calls and time.sleep both release the GIL; bind them to
+        # locals so the Python work held between them per click stays minimal
+        click, sleep = _click, time.sleep
+        stats_lock = self._stats_lock
+        perf_counter = time.perf_counter
+        next_t = perf_counter()
         while self.is_clicking:
             try:
-                # hold mode check
-                if self.click_mode.get() == "hold" and keyboard:
-                    try:
-                        if not keyboard.is_pressed(self.current_hotkey):
-                            time.sleep(0.001)
-                            continue
-                    except Exception:
-                        pass
-
-                clicks = 2 if self.click_type.get() == "double" else 1
-
-                # perform clicks
-                # Use mouseDown/up similarly to original; keep try/except
+                interval = self._cps_interval
+
+                # hold mode check: the keyboard hooks keep _hold_down current;
+                # RegisterHotKey has no release event, so Windows reads the key state
+                if self._mode_cache == "hold":
+                    win_hotkey = self._win_hotkey
+                    held = _key_down(win_hotkey.vk) if win_hotkey is not None else self._hold_down
+                    if not held:
+                        sleep(0.001)
+                        # restart pacing from the moment the key comes back
+                        next_t = perf_counter()
+                        continue
+
+                clicks = 2 if self._click_type_cache == "double" else 1
+                button = self._button_cache
+
+                # perform clicks through the native backend selected at import
                 try:
-                    pyautogui.mouseDown(button=self.button_type.get())
-                    pyautogui.mouseUp(button=self.button_type.get())
-                    if clicks == 2:
-                        pyautogui.mouseDown(button=self.button_type.get())
-                        pyautogui.mouseUp(button=self.button_type.get())
+                    click(button, clicks)
                 except Exception:
-                    # if pyautogui fails for any reason, stop to avoid busy loop
-                    print("pyautogui.click failed; stopping clicking")
-                    self.stop_clicking()
+                    # if the backend fails for any reason, stop to avoid busy loop
+                    print("click failed; stopping clicking")
+                    self.root.after(0, self.stop_clicking)
                     return
 
-                self.total_clicks += clicks
-                self.session_clicks += clicks
-                self.last_second_clicks.append(time.time())
-
-                # update labels occasionally (reduce UI thrash)
-                if self.session_clicks % 10 == 0:
-                    try:
-                        self.total_label.config(text=str(self.total_clicks))
-                        self.session_label.config(text=str(self.session_clicks))
-                    except Exception:
-                        pass
-
-                interval = max(0.002, 1.0 / (max(0.1, float(self.cps.get()))))
-                time.sleep(interval)
+                with stats_lock:
+                    self.total_clicks += clicks
+                    self.session_clicks += clicks
+                    self.click_counter += 1
+
+                # deadline pacing: sleep until the next slot so time spent
+                # clicking doesn't stretch the interval; after a stall, resync
+                # one interval ahead instead of firing the missed clicks at once
+                next_t += interval
+                now = perf_counter()
+                dt = next_t - now
+                if dt > 0:
+                    sleep(dt)
+                elif dt < -interval:
+                    next_t = now + interval
+                    sleep(interval)
             except Exception as e:
-                print("Click error:", e)
-                time.sleep(0.01)
+                now = perf_counter()
+                if now - self._last_err_t > 1.0:
+                    self._last_err_t = now
+                    # windowed builds (pythonw, no-console exe) have no stderr
+                    if sys.stderr is not None:
+                        sys.stderr.write(f"Click error: {e}\n")
+                sleep(0.01)
+
+    def _refresh_stats(self):
+        # Runs on the Tk main thread every 100 ms while clicking; click_loop
+        # only bumps the counters and never touches widgets itself.
+        self._refresh_after = None
+        try:
+            # (timestamp, click_counter) snapshots; the oldest kept one starts a
+            # window of roughly 1s, and CPS is the count divided by its real span
+            with self._stats_lock:
+                total, session, counter = self.total_clicks, self.session_clicks, self.click_counter
+            now = time.perf_counter()
+            samples = self._cps_samples
+            samples.append((now, counter))
+            while len(samples) > 1 and now - samples[1][0] >= 1.0:
+                samples.popleft()
+            span = samples[-1][0] - samples[0][0]
+            self.actual_cps = (samples[-1][1] - samples[0][1]) / span if span > 0 else 0
+
+            self._set_text(self.total_label, str(total))
+            self._set_text(self.session_label, str(session))
+            self._set_text(self.actual_cps_label, f"{self.actual_cps:.1f}")
+        except Exception:
+            pass
+        if self.is_clicking:
+            self._refresh_after = self.root.after(100, self._refresh_stats)
 
-    def monitor_cps(self):
-        while self.is_clicking:
-            try:
-                now = time.time()
-                self.last_second_clicks = [t for t in self.last_second_clicks if now - t <= 1.0]
-                self.actual_cps = len(self.last_second_clicks)
-                try:
-                    self.actual_cps_label.config(text=f"{self.actual_cps:.1f}")
-                except Exception:
-                    pass
-                time.sleep(0.1)
-            except Exception:
-                time.sleep(0.1)
+    def _set_text(self, label, text):
+        # Tk re-lays out a label on every config(text=...), even for the same string
+        if self._label_texts.get(label) != text:
+            label.config(text=text)
+            self._label_texts[label] = text
 
-    def update_timer(self):
-        while self.is_clicking:
-            try:
-                elapsed = int(time.time() - self.start_time)
-                minutes = elapsed // 60
-                seconds = elapsed % 60
-                self.time_label.config(text=f"{minutes:02d}:{seconds:02d}")
-                time.sleep(1)
-            except Exception:
-                time.sleep(1)
+    def _tick_timer(self):
+        # Session clock; one Tk after callback per second, no thread
+        self._timer_after = None
+        try:
+            elapsed = int(time.monotonic() - self.start_time)
+            minutes = elapsed // 60
+            seconds = elapsed % 60
+            self._set_text(self.time_label, f"{minutes:02d}:{seconds:02d}")
+        except Exception:
+            pass
+        if self.is_clicking:
+            self._timer_after = self.root.after(1000, self._tick_timer)
 
     def reset_stats(self):
         if self.is_clicking:
             messagebox.showwarning("Warning", "Stop clicking first")
             return
         if messagebox.askyesno("Confirm", "Reset all statistics?"):
-            self.total_clicks = 0
-            self.session_clicks = 0
-            self.last_second_clicks = []
+            with self._stats_lock:
+                self.total_clicks = 0
+                self.session_clicks = 0
             self.actual_cps = 0
             try:
-                self.total_label.config(text="0")
-                self.session_label.config(text="0")
-                self.time_label.config(text="00:00")
-                self.actual_cps_label.config(text="0.0")
+                self._set_text(self.total_label, "0")
+                self._set_text(self.session_label, "0")
+                self._set_text(self.time_label, "00:00")
+                self._set_text(self.actual_cps_label, "0.0")
             except Exception:
                 pass
             self.status.config(text="Statistics reset")
@@ -521,8 +993,9 @@ class McAllenClicker:
             if not messagebox.askyesno("Exit", "Clicking is active. Exit anyway?"):
                 return
         self.is_clicking = False
+        self._unregister_hotkey()
         try:
-            if keyboard:
+            if keyboard and self._kb_hook_active:
                 keyboard.unhook_all()
         except Exception:
             pass
@@ -531,41 +1004,57 @@ class McAllenClicker:
     # -------------------------
     # Responsive adjustments: font scaling on resize
     # -------------------------
-    def _on_root_resize_throttled(self):
-        # Return a throttled callback to avoid over-calling on resize events
-        last = {"t": 0}
-        def cb(event=None):
-            now = time.time()
-            if now - last["t"] < 0.06:
-                return
-            last["t"] = now
-            self._on_root_resize()
-        return cb
+    def _on_root_configure(self, event):
+        # The root's <Configure> binding also fires for every child widget;
+        # only the window itself matters, and a drag collapses into one pass
+        if event.widget is not self.root:
+            return
+        if self._resize_after_id:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(60, self._on_root_resize)
+
+    def _font(self, size, bold=False):
+        # one font tuple per (size, weight), reused across resizes
+        key = (size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = ("Segoe UI", size, "bold" if bold else "normal")
+        return font
 
     def _on_root_resize(self):
+        self._resize_after_id = None
         try:
             w = max(720, self.root.winfo_width())
-            # scale factor relative to base 960 width
-            scale = min(1.45, max(0.8, w / 960.0))
+            # scale factor relative to base 960 width, quantized to 0.05 steps
+            # so small width changes don't reconfigure fonts at all
+            scale = round(min(1.45, max(0.8, w / 960.0)) * 20) / 20
+            if scale == self._last_scale:
+                return
+            self._last_scale = scale
             # adjust fonts
             big = int(28 * scale)
             med = int(12 * scale)
             small = int(9 * scale)
 
-            self.cps_display.config(font=("Segoe UI", max(14,big), "bold"))
-            self.actual_cps_label.config(font=("Segoe UI", max(16,int(36*scale)), "bold"))
-            self.title_label.config(font=("Segoe UI", max(10,int(16*scale)), "bold"))
-            self.subtitle_label.config(font=("Segoe UI", max(8,int(9*scale))))
-            # adjust fancy button heights by reconfiguring Canvas height
-            for btn in (self.start_btn, self.reset_btn, self.hotkey_btn):
+            self.cps_display.config(font=self._font(max(14,big), bold=True))
+            self.actual_cps_label.config(font=self._font(max(16,int(36*scale)), bold=True))
+            self.title_label.config(font=self._font(max(10,int(16*scale)), bold=True))
+            self.subtitle_label.config(font=self._font(max(8,int(9*scale))))
+            # adjust fancy button heights by reconfiguring Canvas height,
+            # then flush the pending geometry once for all of them
+            for btn, base_h, base_r in zip(self._fancy_buttons, self._btn_base_heights, self._btn_base_radii):
+                h = max(28, int(base_h * scale))
+                r = max(10, int(base_r * scale))
+                if h == btn._height and r == btn._radius:
+                    continue
                 try:
-                    h = max(28, int(34 * scale))
                     btn.config(height=h)
                     btn._height = h
-                    btn._radius = max(10, int(14 * scale))
+                    btn._radius = r
                     btn._draw()
                 except Exception:
                     pass
+            self.root.update_idletasks()
         except Exception:
             pass
 